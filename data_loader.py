@@ -0,0 +1,178 @@
+"""
+Data Loader Module
+------------------
+Shared dataset loader with an on-disk Parquet cache for the analysis scripts.
+Author: Toshit Dwivedi
+Project: Smart Stock Inventory Optimization
+"""
+
+import os
+from functools import lru_cache
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Configure paths (run from project root)
+DATA_PATH = "dataset/updated_dataset.csv"
+
+# Explicit column types for the processed dataset (32-bit integers; Price and
+# the ratio columns stay float64 so written values round-trip exactly, even
+# when every value in the file is whole)
+COLUMN_DTYPES = {
+    "Month_Num": "int32",
+    "Units_Sold": "int32",
+    "Opening_Stock": "int32",
+    "Remaining_Stock": "int32",
+    "Price": "float64",
+    "Revenue_Per_Unit": "float64",
+    "Stock_Turnover_Rate": "float64",
+}
+
+# Parse-time types: integer columns are read as nullable so blank cells (e.g. the
+# Month_Num of an unrecognised month) parse instead of raising; load() then
+# converts them with column_dtypes()
+READ_DTYPES = {col: dtype.capitalize() if dtype.startswith("int") else dtype
+               for col, dtype in COLUMN_DTYPES.items()}
+
+# Columns packed together for the row-major statistics matrix
+CORE_COLUMNS = ["Units_Sold", "Opening_Stock", "Price"]
+
+# Calendar order used for the categorical Month column
+MONTH_ORDER = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+
+def parquet_path(path):
+    """Return the Parquet sidecar path for a CSV file."""
+    return os.path.splitext(path)[0] + ".parquet"
+
+
+def load(path=DATA_PATH, columns=None):
+    """
+    Load a dataset, preferring its Parquet sidecar over the CSV.
+
+    The CSV is parsed with the PyArrow engine on the first call and the
+    result is written next to it as a zstd-compressed Parquet file. Later
+    calls memory-map the Parquet file instead, unless the CSV has been modified
+    since the sidecar was written. Month is returned as an ordered categorical
+    in calendar order. Integer columns with blank cells are returned as
+    float64 with NaN gaps, as pandas reads them by default.
+
+    When only some columns are requested, just those columns are read from
+    the sidecar. Without a fresh sidecar, only those columns are parsed from
+    the CSV, and no sidecar is written because it would be incomplete.
+
+    Parameters:
+    -----------
+    path : str
+        Path to the CSV file
+    columns : list of str, optional
+        Columns to load (all columns if None)
+
+    Returns:
+    --------
+    pandas.DataFrame : Loaded dataset
+    """
+    cache_path = parquet_path(path)
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(path):
+        return pd.read_parquet(cache_path, engine="pyarrow", columns=columns, memory_map=True)
+
+    df = pd.read_csv(path, engine="pyarrow", usecols=columns, dtype=READ_DTYPES)
+
+    # Plain NumPy integers for integer columns without gaps, float64 for the rest
+    df = df.astype(column_dtypes(df))
+
+    # Store Month as ordered categorical codes instead of repeated strings
+    # (labels outside MONTH_ORDER become missing)
+    if "Month" in df.columns:
+        months = df["Month"].where(df["Month"].isin(MONTH_ORDER))
+        present = set(months.dropna().unique())
+        df["Month"] = pd.Categorical(months, categories=[m for m in MONTH_ORDER if m in present], ordered=True)
+
+    if columns is None:
+        write_cache(df, path)
+
+    return df
+
+
+def column_dtypes(df):
+    """
+    COLUMN_DTYPES for the columns present in a DataFrame.
+
+    Integer columns that contain missing values (e.g. Month_Num for an
+    unrecognised month) become float64 with NaN gaps, as pandas reads them by
+    default, so consumers can still fill them with fractional means.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Dataset to cast
+
+    Returns:
+    --------
+    dict : Column name to dtype
+    """
+    dtypes = {}
+    for col, dtype in COLUMN_DTYPES.items():
+        if col in df.columns:
+            if dtype.startswith("int") and df[col].hasnans:
+                dtype = "float64"
+            dtypes[col] = dtype
+    return dtypes
+
+
+def write_cache(df, path=DATA_PATH):
+    """
+    Write a DataFrame as the Parquet sidecar of a CSV file.
+
+    Numeric columns are cast to COLUMN_DTYPES first (float64 where an integer
+    column has missing values), so the sidecar has the same schema whether it
+    was written by load() or by the pipeline that produced the CSV. Call it
+    after the CSV itself has been written, because load() only trusts a
+    sidecar that is at least as new as the CSV.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Dataset to cache
+    path : str
+        Path to the CSV file the sidecar belongs to
+    """
+    table = pa.Table.from_pandas(df.astype(column_dtypes(df)), preserve_index=False)
+    pq.write_table(table, parquet_path(path), compression="zstd")
+
+
+@lru_cache(maxsize=1)
+def load_dataset():
+    """
+    Load the processed dataset once per process and reuse it.
+
+    Every caller receives the same DataFrame, so it must be treated as
+    read-only; copy it before adding or overwriting columns.
+
+    Returns:
+    --------
+    pandas.DataFrame : Dataset at DATA_PATH
+    """
+    return load(DATA_PATH)
+
+
+def core_matrix(df, dtype=np.float64):
+    """
+    Pack the core numeric columns into one contiguous (n_rows, 3) array.
+
+    Rows hold Units_Sold, Opening_Stock and Price side by side, so axis-0
+    reductions walk a single buffer instead of three separate columns.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Dataset returned by load()
+    dtype : numpy.dtype
+        Element type of the matrix
+
+    Returns:
+    --------
+    numpy.ndarray : C-contiguous matrix with columns in CORE_COLUMNS order
+    """
+    return np.ascontiguousarray(df[CORE_COLUMNS].to_numpy(dtype=dtype))
@@ -7,27 +7,53 @@ Project: Smart Stock Inventory Optimization
 """
 
 import numpy as np
-import pandas as pd
+
+from data_loader import load
 
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 
 
-def demonstrate_array_operations():
-    """Demonstrate various NumPy array operations."""
+def pearson_correlation(x, y):
+    """
+    Compute the Pearson correlation of two 1-D arrays from five running sums.
+    
+    Both arrays are shifted by their first element before summing, which keeps
+    the single-pass formula numerically stable without a separate mean pass.
+    
+    Parameters:
+    -----------
+    x, y : numpy.ndarray
+        Arrays of equal length
+        
+    Returns:
+    --------
+    float : Correlation coefficient
+    """
+    x = x - np.float64(x[0])
+    y = y - np.float64(y[0])
+    n = x.size
+    sum_x, sum_y = x.sum(), y.sum()
+    sum_xx, sum_yy, sum_xy = np.dot(x, x), np.dot(y, y), np.dot(x, y)
+    return (n * sum_xy - sum_x * sum_y) / np.sqrt((n * sum_xx - sum_x ** 2) * (n * sum_yy - sum_y ** 2))
+
+
+def demonstrate_array_operations(df=None):
+    """Demonstrate various NumPy array operations (loads the dataset if df is None)."""
     
     print("\n" + "=" * 60)
     print("NUMPY ARRAY OPERATIONS DEMONSTRATION")
     print("=" * 60 + "\n")
     
     # Load data
-    df = pd.read_csv(DATA_PATH)
+    if df is None:
+        df = load(DATA_PATH)
     print("✓ Data loaded successfully\n")
     
-    # Extract arrays
-    units_sold = np.array(df["Units_Sold"])
-    prices = np.array(df["Price"])
-    opening_stock = np.array(df["Opening_Stock"])
+    # Extract arrays (views over the column buffers, no copy)
+    units_sold = df["Units_Sold"].to_numpy(copy=False)
+    prices = df["Price"].to_numpy(copy=False)
+    opening_stock = df["Opening_Stock"].to_numpy(copy=False)
     
     print("1. BASIC ARRAY INFORMATION")
     print("-" * 60)
@@ -60,22 +86,25 @@ def demonstrate_array_operations():
     print("\n4. CONDITIONAL OPERATIONS")
     print("-" * 60)
     
-    # High sales products
+    # High sales products (count and mean reduced over the mask, no gathered copy)
     high_sales_threshold = 100
-    high_sales = units_sold[units_sold > high_sales_threshold]
-    print(f"   Products with >{high_sales_threshold} units sold: {len(high_sales)}")
-    print(f"   Average of high sellers: {np.mean(high_sales):.2f} units")
+    high_sales_mask = units_sold > high_sales_threshold
+    high_sales_count = np.count_nonzero(high_sales_mask)
+    high_sales_total = np.sum(units_sold, where=high_sales_mask)
+    high_sales_mean = high_sales_total / high_sales_count if high_sales_count else 0.0
+    print(f"   Products with >{high_sales_threshold} units sold: {high_sales_count}")
+    print(f"   Average of high sellers: {high_sales_mean:.2f} units")
     
     # Low stock products
     low_stock_threshold = 150
-    low_stock_count = np.sum(opening_stock < low_stock_threshold)
+    low_stock_count = np.count_nonzero(opening_stock < low_stock_threshold)
     print(f"   Products with <{low_stock_threshold} opening stock: {low_stock_count}")
     
     print("\n5. CORRELATION ANALYSIS")
     print("-" * 60)
     
     # Correlation between price and units sold
-    correlation = np.corrcoef(prices, units_sold)[0, 1]
+    correlation = pearson_correlation(prices, units_sold)
     print(f"   Price vs Units Sold Correlation: {correlation:.4f}")
     
     if correlation < -0.3:
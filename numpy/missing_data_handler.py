@@ -8,24 +8,154 @@ Project: Smart Stock Inventory Optimization
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import argparse
 import os
 
+from data_loader import load
+
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 OUTPUT_DIR = "output"
 
+# Rows per chunk when streaming large CSV files
+CHUNK_SIZE = 100_000
+
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
-def demonstrate_missing_data_handling():
-    """Demonstrate various techniques for handling missing data."""
+def forward_fill(values):
+    """
+    Forward-fill NaNs down each column of a 2-D float array.
+    
+    Every row is tagged with its own index unless it is NaN; a running
+    maximum over those tags then points each NaN at the last valid row above
+    it, so the whole fill is one vectorized scan and one gather.
+    
+    Parameters:
+    -----------
+    values : numpy.ndarray
+        Float array of shape (n_rows, n_columns)
+        
+    Returns:
+    --------
+    numpy.ndarray : Filled copy (leading NaNs stay NaN)
+    """
+    rows = np.arange(values.shape[0])[:, None]
+    source = np.where(np.isnan(values), 0, rows)
+    np.maximum.accumulate(source, axis=0, out=source)
+    return np.take_along_axis(values, source, axis=0)
+
+
+def backward_fill(values):
+    """Backward-fill NaNs up each column of a 2-D float array."""
+    return forward_fill(values[::-1])[::-1]
+
+
+def stream_impute(input_path, output_path, method="mean", chunksize=CHUNK_SIZE):
+    """
+    Clean the numeric gaps of a CSV file without loading it whole.
+    
+    A first pass counts the missing values and accumulates per-column sums
+    and counts. A second pass cleans each chunk and appends it to a Parquet
+    file, so peak memory follows the chunk size rather than the file size.
+    Forward fill carries the last valid row from one chunk into the next.
+    Backward fill holds a chunk back only until a later chunk supplies the
+    values for its trailing gaps.
+    
+    Parameters:
+    -----------
+    input_path : str
+        CSV file to clean
+    output_path : str
+        Parquet file to write
+    method : str
+        "mean", "ffill", "bfill" or "drop" (drop rows with any gap)
+    chunksize : int
+        Rows read per chunk
+        
+    Returns:
+    --------
+    pandas.Series : Missing values per numeric column in the input
+    """
+    if method not in ("mean", "ffill", "bfill", "drop"):
+        raise ValueError(f"Unknown imputation method: {method}")
+    
+    sums = counts = null_counts = None
+    float_cols = set()
+    for chunk in pd.read_csv(input_path, chunksize=chunksize):
+        numeric = chunk.select_dtypes(include=[np.number])
+        float_cols.update(numeric.select_dtypes(include="float").columns)
+        if sums is None:
+            sums, counts, null_counts = numeric.sum(), numeric.count(), numeric.isnull().sum()
+        else:
+            sums = sums.add(numeric.sum(), fill_value=0)
+            counts = counts.add(numeric.count(), fill_value=0)
+            null_counts = null_counts.add(numeric.isnull().sum(), fill_value=0)
+    
+    means = sums / counts
+    fill_cols = null_counts[null_counts > 0].index
+    
+    # Fixed types for the second pass and the Parquet schema, decided over the
+    # whole file rather than by the first chunk: a numeric column is float64 if
+    # any chunk had fractions or gaps in it and int64 otherwise
+    dtypes = {col: "float64" if col in float_cols else "int64" for col in sums.index}
+    dtypes.update({col: "str" for col in chunk.columns if col not in dtypes})
+    template = pd.DataFrame({col: pd.Series(dtype=dtypes[col]) for col in chunk.columns})
+    schema = pa.Schema.from_pandas(template, preserve_index=False)
+    writer = pq.ParquetWriter(output_path, schema, compression="zstd")
+    
+    def write(chunk):
+        writer.write_table(pa.Table.from_pandas(chunk, preserve_index=False).cast(schema))
+    
+    carry = np.full((1, len(fill_cols)), np.nan)  # last row seen, for ffill
+    pending = []                                  # chunks awaiting later values, for bfill
+    for chunk in pd.read_csv(input_path, chunksize=chunksize, dtype=dtypes):
+        values = chunk[fill_cols].to_numpy(dtype=np.float64)
+        
+        if method == "mean":
+            values = np.where(np.isnan(values), means[fill_cols].to_numpy(), values)
+        elif method == "ffill":
+            values = forward_fill(np.vstack([carry, values]))[1:]
+            carry = values[-1:]
+        elif method == "bfill":
+            values = backward_fill(values)
+            # Remaining gaps are trailing runs; this chunk's first row holds the next valid values
+            head = values[:1]
+            for _, waiting_values in pending:
+                np.copyto(waiting_values, head, where=np.isnan(waiting_values) & ~np.isnan(head))
+            pending.append((chunk, values))
+            while pending and not np.isnan(pending[0][1]).any():
+                waiting, waiting_values = pending.pop(0)
+                waiting[fill_cols] = waiting_values
+                write(waiting)
+            continue
+        
+        chunk[fill_cols] = values
+        if method == "drop":
+            chunk = chunk.dropna(subset=fill_cols)
+        write(chunk)
+    
+    # Gaps after the last valid value have nothing to fill them
+    for waiting, waiting_values in pending:
+        waiting[fill_cols] = waiting_values
+        write(waiting)
+    writer.close()
+    
+    return null_counts.astype(np.int64)
+
+
+def demonstrate_missing_data_handling(df=None):
+    """Demonstrate various techniques for handling missing data (loads the dataset if df is None)."""
     
     print("\n" + "=" * 60)
     print("MISSING DATA HANDLING DEMONSTRATION")
     print("=" * 60 + "\n")
     
     # Load data
-    df = pd.read_csv(DATA_PATH)
+    if df is None:
+        df = load(DATA_PATH)
     print("✓ Original data loaded\n")
     
     print("Step 1: Original Dataset")
@@ -39,12 +169,12 @@ def demonstrate_missing_data_handling():
     print("\n\nStep 2: Intentionally Insert Missing Values (for demonstration)")
     print("-" * 60)
     
-    # Insert NaN values at specific positions
-    df_demo.loc[0, "Units_Sold"] = np.nan
-    df_demo.loc[2, "Opening_Stock"] = np.nan
-    df_demo.loc[5, "Price"] = np.nan
-    df_demo.loc[10, "Units_Sold"] = np.nan
-    df_demo.loc[15, "Opening_Stock"] = np.nan
+    # Insert NaN values at specific positions (one buffer write per column)
+    nan_positions = {"Units_Sold": [0, 10], "Opening_Stock": [2, 15], "Price": [5]}
+    for col, positions in nan_positions.items():
+        values = df_demo[col].to_numpy(dtype=np.float64, copy=True)
+        values[positions] = np.nan
+        df_demo[col] = values
     
     print("Missing values inserted:")
     print(df_demo.isnull().sum())
@@ -70,28 +200,26 @@ def demonstrate_missing_data_handling():
     
     print("\n\nStep 6: Handle Missing Data - Method 3 (Fill with Mean)")
     print("-" * 60)
-    df_filled = df_demo.copy()
     
-    # Fill numeric columns with mean
-    numeric_cols = df_filled.select_dtypes(include=[np.number]).columns
-    for col in numeric_cols:
-        if df_filled[col].isnull().any():
-            mean_value = df_filled[col].mean()
-            df_filled[col] = df_filled[col].fillna(mean_value)
-            print(f"  {col}: Filled {df_demo[col].isnull().sum()} values with mean ({mean_value:.2f})")
+    # Fill numeric columns with mean (one reduction and one fill across all columns)
+    numeric_cols = df_demo.select_dtypes(include=[np.number]).columns
+    null_counts = df_demo[numeric_cols].isnull().sum()
+    means = df_demo[numeric_cols].mean()
+    df_filled = df_demo.fillna(means)
+    for col, count in null_counts[null_counts > 0].items():
+        print(f"  {col}: Filled {count} values with mean ({means[col]:.2f})")
     
     print(f"\nTotal null values after filling: {df_filled.isnull().sum().sum()}")
     
     print("\n\nStep 7: Handle Missing Data - Method 4 (Forward Fill)")
     print("-" * 60)
-    df_ffill = df_demo.copy()
-    df_ffill = df_ffill.fillna(method='ffill')
+    numeric_values = df_demo[numeric_cols].to_numpy(dtype=np.float64)
+    df_ffill = df_demo.assign(**dict(zip(numeric_cols, forward_fill(numeric_values).T)))
     print(f"Null values after forward fill: {df_ffill.isnull().sum().sum()}")
     
     print("\n\nStep 8: Handle Missing Data - Method 5 (Backward Fill)")
     print("-" * 60)
-    df_bfill = df_demo.copy()
-    df_bfill = df_bfill.fillna(method='bfill')
+    df_bfill = df_demo.assign(**dict(zip(numeric_cols, backward_fill(numeric_values).T)))
     print(f"Null values after backward fill: {df_bfill.isnull().sum().sum()}")
     
     # Save cleaned data
@@ -105,8 +233,23 @@ def demonstrate_missing_data_handling():
     print("→ Use Mean Imputation for numerical columns")
     print("→ Original dataset has no missing values")
     print("→ Always validate data before and after cleaning")
+    print("→ For CSVs too large for memory, run with --stream <file> [--method ...]")
     print("=" * 60 + "\n")
 
 
 if __name__ == "__main__":
-    demonstrate_missing_data_handling()
+    parser = argparse.ArgumentParser(description="Missing data handling demonstration")
+    parser.add_argument("--stream", metavar="CSV",
+                        help="clean this CSV in chunks instead of running the in-memory demo")
+    parser.add_argument("--method", choices=["mean", "ffill", "bfill", "drop"], default="mean",
+                        help="imputation used with --stream (default: mean)")
+    args = parser.parse_args()
+    
+    if args.stream:
+        stream_path = os.path.join(OUTPUT_DIR, f"cleaned_data_{args.method}_stream.parquet")
+        print(f"Streaming {args.stream} in chunks of {CHUNK_SIZE:,} rows ({args.method})...")
+        missing = stream_impute(args.stream, stream_path, method=args.method)
+        print(f"Missing values in input: {missing.sum()}")
+        print(f"✓ Streamed data saved to: {stream_path}")
+    else:
+        demonstrate_missing_data_handling()
@@ -7,9 +7,10 @@ Project: Smart Stock Inventory Optimization
 """
 
 import numpy as np
-import pandas as pd
 import os
 
+from data_loader import core_matrix, load
+
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 OUTPUT_DIR = "output"
@@ -21,7 +22,7 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 def load_data():
     """Load sales data from CSV file."""
     try:
-        df = pd.read_csv(DATA_PATH)
+        df = load(DATA_PATH)
         print("✓ Data loaded successfully")
         return df
     except FileNotFoundError:
@@ -29,6 +30,44 @@ def load_data():
         return None
 
 
+def column_reductions(matrix):
+    """
+    Compute per-column summary statistics of a 2-D array.
+    
+    Each statistic is its own reduction along axis 0, covering all columns at
+    once: a sum and an einsum sum of squares over the rows shifted by the
+    first row, max and min, and one np.partition for the median. The shifted
+    sums give the mean and standard deviation together, without the
+    precision loss of the naive sum-of-squares formula.
+    
+    Parameters:
+    -----------
+    matrix : numpy.ndarray
+        Array of shape (n_rows, n_columns)
+        
+    Returns:
+    --------
+    dict : Arrays of length n_columns keyed by statistic name
+    """
+    n = matrix.shape[0]
+    shifted = matrix - matrix[0]
+    shifted_sum = shifted.sum(axis=0)
+    shifted_sumsq = np.einsum("ij,ij->j", shifted, shifted)
+    
+    # Median from a single partition around the middle element(s)
+    middle = [(n - 1) // 2, n // 2]
+    partitioned = np.partition(matrix, middle, axis=0)
+    
+    return {
+        "max": matrix.max(axis=0),
+        "min": matrix.min(axis=0),
+        "sum": shifted_sum + n * matrix[0],
+        "mean": matrix[0] + shifted_sum / n,
+        "median": partitioned[middle].mean(axis=0),
+        "std": np.sqrt(np.maximum(shifted_sumsq / n - (shifted_sum / n) ** 2, 0.0)),
+    }
+
+
 def statistical_operations(data):
     """
     Perform comprehensive statistical operations on sales data.
@@ -42,34 +81,18 @@ def statistical_operations(data):
     --------
     dict : Statistical metrics
     """
-    units = np.array(data["Units_Sold"])
-    opening_stock = np.array(data["Opening_Stock"])
-    prices = np.array(data["Price"])
-    
-    stats = {
-        "Units Sold": {
-            "Maximum": np.max(units),
-            "Minimum": np.min(units),
-            "Mean": np.mean(units),
-            "Median": np.median(units),
-            "Std Dev": np.std(units),
-            "Total": np.sum(units)
-        },
-        "Opening Stock": {
-            "Maximum": np.max(opening_stock),
-            "Minimum": np.min(opening_stock),
-            "Mean": np.mean(opening_stock),
-            "Median": np.median(opening_stock),
-            "Std Dev": np.std(opening_stock)
-        },
-        "Prices": {
-            "Maximum": np.max(prices),
-            "Minimum": np.min(prices),
-            "Mean": np.mean(prices),
-            "Median": np.median(prices),
-            "Std Dev": np.std(prices)
+    reduced = column_reductions(core_matrix(data))
+    
+    stats = {}
+    for i, category in enumerate(["Units Sold", "Opening Stock", "Prices"]):
+        stats[category] = {
+            "Maximum": reduced["max"][i],
+            "Minimum": reduced["min"][i],
+            "Mean": reduced["mean"][i],
+            "Median": reduced["median"][i],
+            "Std Dev": reduced["std"][i]
         }
-    }
+    stats["Units Sold"]["Total"] = reduced["sum"][0]
     
     return stats
 
@@ -87,9 +110,10 @@ def calculate_remaining_stock(data):
     --------
     numpy.ndarray : Remaining stock values
     """
-    demand = np.array(data["Units_Sold"])
-    stock = np.array(data["Opening_Stock"])
-    remaining = stock - demand
+    demand = data["Units_Sold"].to_numpy(copy=False)
+    stock = data["Opening_Stock"].to_numpy(copy=False)
+    remaining = np.empty_like(stock)
+    np.subtract(stock, demand, out=remaining)
     
     return remaining
 
@@ -113,14 +137,15 @@ def save_statistics(stats, filename="statistical_summary.txt"):
     print(f"\n✓ Statistics saved to: {output_path}")
 
 
-def main():
-    """Main execution function."""
+def main(df=None):
+    """Main execution function (loads the dataset if df is None)."""
     print("\n" + "=" * 60)
     print("NUMPY STATISTICAL ANALYSIS")
     print("=" * 60 + "\n")
     
     # Load data
-    df = load_data()
+    if df is None:
+        df = load_data()
     if df is None:
         return
     
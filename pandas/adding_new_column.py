@@ -1,8 +1,16 @@
-import pandas as pd
+import numpy as np
+
+from data_loader import load
 
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 
-df = pd.read_csv(DATA_PATH)
-df["Remaining_Stock"] = df["Opening_Stock"] - df["Units_Sold"]
+df = load(DATA_PATH)
+
+# Subtract into a preallocated buffer of the (int32) stock dtype
+opening_stock = df["Opening_Stock"].to_numpy()
+units_sold = df["Units_Sold"].to_numpy()
+remaining = np.empty_like(opening_stock)
+np.subtract(opening_stock, units_sold, out=remaining)
+df["Remaining_Stock"] = remaining
 print(df[["Product_Name", "Opening_Stock", "Units_Sold", "Remaining_Stock"]])
@@ -10,6 +10,8 @@ import pandas as pd
 import numpy as np
 import os
 
+from data_loader import load
+
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 OUTPUT_DIR = "output"
@@ -26,12 +28,21 @@ def pivot_operations(df):
     # Pivot 1: Product by Month
     print("\n1. Units Sold - Products vs Months")
     print("-" * 60)
-    pivot1 = df.pivot_table(
-        values="Units_Sold",
-        index="Product_Name",
-        columns="Month",
-        aggfunc="sum",
-        fill_value=0
+    # Dense product x month matrix from integer codes, no hash tables or sort
+    product_codes, products = pd.factorize(df["Product_Name"], sort=True)
+    month_codes = df["Month"].cat.codes.to_numpy()
+    months = df["Month"].cat.categories
+    # Missing names/months get code -1; drop them like pivot_table drops NaN keys
+    keep = (product_codes >= 0) & (month_codes >= 0)
+    cells = np.bincount(
+        product_codes[keep] * len(months) + month_codes[keep],
+        weights=df["Units_Sold"].to_numpy()[keep],
+        minlength=len(products) * len(months)
+    )
+    pivot1 = pd.DataFrame(
+        cells.astype(np.int64).reshape(len(products), len(months)),
+        index=pd.Index(products, name="Product_Name"),
+        columns=pd.Index(months, name="Month")
     )
     print(pivot1.head(10))
     
@@ -120,9 +131,13 @@ def time_series_analysis(df):
     print("-" * 60)
     print(monthly_trend)
     
-    # Calculate growth rates
-    monthly_trend["Sales_Growth_%"] = monthly_trend["Units_Sold"].pct_change() * 100
-    monthly_trend["Revenue_Growth_%"] = monthly_trend["Total_Sales_Value"].pct_change() * 100
+    # Calculate growth rates (one shifted-array expression per series)
+    for col, growth_col in [("Units_Sold", "Sales_Growth_%"), ("Total_Sales_Value", "Revenue_Growth_%")]:
+        values = monthly_trend[col].to_numpy(dtype=np.float64)
+        growth = np.empty_like(values)
+        growth[0] = np.nan
+        growth[1:] = (values[1:] / values[:-1] - 1) * 100
+        monthly_trend[growth_col] = growth
     
     print("\n\n2. Month-over-Month Growth")
     print("-" * 60)
@@ -131,8 +146,17 @@ def time_series_analysis(df):
     # Product-wise trends
     print("\n\n3. Top 5 Products with Highest Growth")
     print("-" * 60)
-    product_trend = df.groupby(["Product_Name", "Month_Num"])["Units_Sold"].sum().unstack(fill_value=0)
-    product_growth = ((product_trend[6] - product_trend[1]) / product_trend[1] * 100).sort_values(ascending=False)
+    # Only the first and last month are needed, so pivot just those two
+    endpoints = df[df["Month_Num"].isin([1, 6])]
+    product_trend = (
+        endpoints.groupby(["Product_Name", "Month_Num"])["Units_Sold"].sum()
+        .unstack(fill_value=0)
+        .reindex(columns=[1, 6], fill_value=0)
+    )
+    first = product_trend[1].to_numpy(dtype=np.float64)
+    last = product_trend[6].to_numpy(dtype=np.float64)
+    growth = np.divide((last - first) * 100, first, out=np.full_like(first, np.nan), where=first > 0)
+    product_growth = pd.Series(growth, index=product_trend.index).sort_values(ascending=False)
     print(product_growth.head())
     
     # Save time series data
@@ -149,7 +173,23 @@ def statistical_summary(df):
     
     numeric_cols = ["Units_Sold", "Price", "Opening_Stock", "Total_Sales_Value"]
     
-    summary = df[numeric_cols].describe().T
+    # Same table as describe().T, with each statistic reduced across all columns at once
+    values = df[numeric_cols].to_numpy(dtype=np.float64)
+    n = values.shape[0]
+    shifted = values - values[0]
+    shifted_sum = shifted.sum(axis=0)
+    shifted_sumsq = np.einsum("ij,ij->j", shifted, shifted)
+    quartiles = np.quantile(values, [0.25, 0.5, 0.75], axis=0)
+    summary = pd.DataFrame({
+        "count": np.full(len(numeric_cols), float(n)),
+        "mean": values[0] + shifted_sum / n,
+        "std": np.sqrt((shifted_sumsq - shifted_sum ** 2 / n) / (n - 1)),
+        "min": values.min(axis=0),
+        "25%": quartiles[0],
+        "50%": quartiles[1],
+        "75%": quartiles[2],
+        "max": values.max(axis=0)
+    }, index=numeric_cols)
     summary["range"] = summary["max"] - summary["min"]
     summary["cv"] = (summary["std"] / summary["mean"] * 100).round(2)  # Coefficient of variation
     
@@ -160,7 +200,8 @@ def statistical_summary(df):
     # Correlation analysis
     print("\n\nCorrelation Matrix:")
     print("-" * 60)
-    correlation = df[numeric_cols].corr().round(3)
+    # Whole matrix from one covariance product over the stacked columns
+    correlation = pd.DataFrame(np.corrcoef(values, rowvar=False), index=numeric_cols, columns=numeric_cols).round(3)
     print(correlation)
     
     # Save statistical summary
@@ -170,14 +211,15 @@ def statistical_summary(df):
     return summary, correlation
 
 
-def main():
-    """Main execution function."""
+def main(df=None):
+    """Main execution function (loads the dataset if df is None)."""
     print("\n" + "=" * 70)
     print(" " * 15 + "ADVANCED DATA ANALYSIS")
     print("=" * 70)
     
     # Load data
-    df = pd.read_csv(DATA_PATH)
+    if df is None:
+        df = load(DATA_PATH)
     print(f"\n✓ Data loaded: {df.shape[0]} records")
     
     # Pivot operations
@@ -7,8 +7,11 @@ Project: Smart Stock Inventory Optimization
 """
 
 import pandas as pd
+import numpy as np
 import os
 
+from data_loader import load
+
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 OUTPUT_DIR = "output"
@@ -16,9 +19,10 @@ OUTPUT_DIR = "output"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
-def load_and_explore_data():
-    """Load and display basic information about the dataset."""
-    df = pd.read_csv(DATA_PATH)
+def load_and_explore_data(df=None):
+    """Load (if df is None) and display basic information about the dataset."""
+    if df is None:
+        df = load(DATA_PATH)
     
     print("\n" + "=" * 60)
     print("DATASET OVERVIEW")
@@ -32,37 +36,46 @@ def load_and_explore_data():
 
 
 def filtering_operations(df):
-    """Demonstrate various filtering operations."""
+    """
+    Demonstrate various filtering operations.
+    
+    Summary figures are reduced straight from boolean masks over the column
+    arrays, so no filtered DataFrame is materialized. The masks are returned
+    for callers that need the matching rows.
+    """
     print("\n\n" + "=" * 60)
     print("FILTERING OPERATIONS")
     print("=" * 60)
     
+    units = df["Units_Sold"].to_numpy()
+    prices = df["Price"].to_numpy()
+    
     # Filter 1: High sales products
     print("\n1. Products with high sales (>100 units)")
     print("-" * 60)
-    high_sales = df[df["Units_Sold"] > 100]
-    print(f"   Found: {len(high_sales)} products")
-    print(f"   Average sales: {high_sales['Units_Sold'].mean():.2f} units")
+    high_sales = units > 100
+    print(f"   Found: {np.count_nonzero(high_sales)} products")
+    print(f"   Average sales: {units.mean(where=high_sales):.2f} units")
     
     # Filter 2: Premium products
     print("\n2. Premium products (Price > 50)")
     print("-" * 60)
-    premium = df[df["Price"] > 50]
-    print(f"   Found: {len(premium)} products")
-    print(f"   Average price: ${premium['Price'].mean():.2f}")
+    premium = prices > 50
+    print(f"   Found: {np.count_nonzero(premium)} products")
+    print(f"   Average price: ${prices.mean(dtype=np.float64, where=premium):.2f}")
     
     # Filter 3: Multiple conditions
     print("\n3. High value products (Price > 50 AND Units_Sold > 80)")
     print("-" * 60)
-    high_value = df[(df["Price"] > 50) & (df["Units_Sold"] > 80)]
-    print(f"   Found: {len(high_value)} products")
+    high_value = premium & (units > 80)
+    print(f"   Found: {np.count_nonzero(high_value)} products")
     
     # Filter 4: Products by month
     print("\n4. Products sold in specific months")
     print("-" * 60)
-    jan_sales = df[df["Month"] == "Jan"]
-    print(f"   January sales: {len(jan_sales)} records")
-    print(f"   Total units: {jan_sales['Units_Sold'].sum()}")
+    jan_sales = df["Month_Num"].to_numpy() == 1
+    print(f"   January sales: {np.count_nonzero(jan_sales)} records")
+    print(f"   Total units: {units.sum(where=jan_sales)}")
     
     return high_sales, premium, high_value
 
@@ -76,16 +89,43 @@ def aggregation_operations(df):
     # Group by product
     print("\n1. Total sales by product")
     print("-" * 60)
-    product_sales = df.groupby("Product_Name")["Total_Sales_Value"].sum().sort_values(ascending=False)
+    # Sort rows by product code once, reduce each segment, then rank the k totals
+    product_codes, products = pd.factorize(df["Product_Name"], sort=True)
+    # Rows without a product name (code -1) are left out, as groupby drops NaN keys
+    named = np.flatnonzero(product_codes >= 0)
+    order = named[np.argsort(product_codes[named], kind="stable")]
+    sorted_codes = product_codes[order]
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(sorted_codes)) + 1))
+    sums = np.add.reduceat(df["Total_Sales_Value"].to_numpy()[order], starts)
+    rank = np.argsort(-sums, kind="stable")
+    product_sales = pd.Series(
+        sums[rank],
+        index=pd.Index(products[sorted_codes[starts]][rank], name="Product_Name"),
+        name="Total_Sales_Value"
+    )
     print(product_sales.head(10))
     
     # Group by month
     print("\n\n2. Monthly sales summary")
     print("-" * 60)
-    monthly_sales = df.groupby("Month").agg({
-        "Units_Sold": ["sum", "mean", "max"],
-        "Total_Sales_Value": ["sum", "mean"]
-    }).round(2)
+    # Sort once by month number, then reduce each contiguous month segment
+    # (rows with an unrecognised month have NaN Month_Num and are left out, as groupby drops NaN keys)
+    month_num = df["Month_Num"].to_numpy()
+    known = np.flatnonzero(df["Month_Num"].notna().to_numpy())
+    order = known[np.argsort(month_num[known], kind="stable")]
+    _, starts = np.unique(month_num[order], return_index=True)
+    counts = np.diff(np.append(starts, len(order)))
+    units = df["Units_Sold"].to_numpy()[order]
+    sales_value = df["Total_Sales_Value"].to_numpy()[order]
+    units_sum = np.add.reduceat(units, starts, dtype=np.int64)
+    sales_sum = np.add.reduceat(sales_value, starts)
+    monthly_sales = pd.DataFrame({
+        ("Units_Sold", "sum"): units_sum,
+        ("Units_Sold", "mean"): units_sum / counts,
+        ("Units_Sold", "max"): np.maximum.reduceat(units, starts),
+        ("Total_Sales_Value", "sum"): sales_sum,
+        ("Total_Sales_Value", "mean"): sales_sum / counts
+    }, index=pd.Index(df["Month"].to_numpy()[order][starts], name="Month")).round(2)
     print(monthly_sales)
     
     # Group by product and month
@@ -106,7 +146,7 @@ def sorting_operations(df):
     # Sort by units sold
     print("\n1. Top 10 best-selling records")
     print("-" * 60)
-    top_sellers = df.sort_values("Units_Sold", ascending=False).head(10)
+    top_sellers = df.nlargest(10, "Units_Sold")
     print(top_sellers[["Product_Name", "Month", "Units_Sold", "Total_Sales_Value"]])
     
     # Sort by multiple columns
@@ -124,23 +164,40 @@ def data_transformation(df):
     print("DATA TRANSFORMATION")
     print("=" * 60)
     
-    # Create a copy
-    df_transformed = df.copy()
+    # Work on the underlying arrays, writing every result into a preallocated buffer
+    units = df["Units_Sold"].to_numpy()
+    stock = df["Opening_Stock"].to_numpy()
+    sales_value = df["Total_Sales_Value"].to_numpy()
+    n = len(units)
+    remaining = np.empty_like(stock)
+    efficiency = np.empty(n, dtype=np.float64)
+    revenue_per_unit = np.empty(n, dtype=np.float64)
+    stockout_risk = np.empty(n, dtype=bool)
     
-    # Add remaining stock
-    df_transformed["Remaining_Stock"] = df_transformed["Opening_Stock"] - df_transformed["Units_Sold"]
-    print("\n1. Added 'Remaining_Stock' column")
+    # Remaining stock
+    np.subtract(stock, units, out=remaining)
     
-    # Add stock efficiency
-    df_transformed["Stock_Efficiency"] = (df_transformed["Units_Sold"] / df_transformed["Opening_Stock"] * 100).round(2)
-    print("2. Added 'Stock_Efficiency' column (% of stock sold)")
+    # Stock efficiency (scaled and rounded in place on one buffer)
+    np.divide(units, stock, out=efficiency)
+    np.multiply(efficiency, 100, out=efficiency)
+    np.round(efficiency, 2, out=efficiency)
     
-    # Add revenue per unit
-    df_transformed["Revenue_Per_Unit"] = df_transformed["Total_Sales_Value"] / df_transformed["Units_Sold"]
-    print("3. Added 'Revenue_Per_Unit' column")
+    # Revenue per unit
+    np.divide(sales_value, units, out=revenue_per_unit)
+    
+    # Stockout risk flag
+    np.greater(efficiency, 70, out=stockout_risk)
     
-    # Add stockout risk flag
-    df_transformed["Stockout_Risk"] = df_transformed["Stock_Efficiency"] > 70
+    # Attach all new columns at once; existing columns are shared, not copied
+    df_transformed = df.assign(
+        Remaining_Stock=remaining,
+        Stock_Efficiency=efficiency,
+        Revenue_Per_Unit=revenue_per_unit,
+        Stockout_Risk=stockout_risk
+    )
+    print("\n1. Added 'Remaining_Stock' column")
+    print("2. Added 'Stock_Efficiency' column (% of stock sold)")
+    print("3. Added 'Revenue_Per_Unit' column")
     print("4. Added 'Stockout_Risk' flag (efficiency > 70%)")
     
     print(f"\n✓ Transformed dataset shape: {df_transformed.shape}")
@@ -172,14 +229,14 @@ def save_analysis_results(df, product_sales, monthly_sales):
     print(f"✓ Monthly sales summary saved: {output_path}")
 
 
-def main():
-    """Main execution function."""
+def main(df=None):
+    """Main execution function (loads the dataset if df is None)."""
     print("\n" + "=" * 70)
     print(" " * 15 + "PANDAS DATA MANIPULATION")
     print("=" * 70)
     
     # Load data
-    df = load_and_explore_data()
+    df = load_and_explore_data(df)
     
     # Filtering
     high_sales, premium, high_value = filtering_operations(df)
@@ -1,9 +1,9 @@
-import pandas as pd
+from data_loader import load
 
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 
-df = pd.read_csv(DATA_PATH)
+df = load(DATA_PATH)
 high_sales = df[df["Units_Sold"] > 80]
 
 print("Products with high sales (>80 units):")
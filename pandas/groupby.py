@@ -1,10 +1,22 @@
+import numpy as np
 import pandas as pd
 
+from data_loader import load
+
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 
-df = pd.read_csv(DATA_PATH)
-monthly_sales = df.groupby("Month")["Total_Sales_Value"].sum()
+df = load(DATA_PATH)
+
+# Sort once by month number, then sum each contiguous month segment
+# (rows with an unrecognised month have NaN Month_Num and are left out, as groupby drops NaN keys)
+month_num = df["Month_Num"].to_numpy()
+known = np.flatnonzero(df["Month_Num"].notna().to_numpy())
+order = known[np.argsort(month_num[known], kind="stable")]
+_, starts = np.unique(month_num[order], return_index=True)
+sums = np.add.reduceat(df["Total_Sales_Value"].to_numpy()[order], starts)
+monthly_sales = pd.Series(sums, index=pd.Index(df["Month"].to_numpy()[order][starts], name="Month"),
+                          name="Total_Sales_Value")
 
 print("Monthly Sales:")
 print(monthly_sales)
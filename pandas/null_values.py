@@ -1,8 +1,8 @@
-import pandas as pd
+from data_loader import load
 
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 
-df = pd.read_csv(DATA_PATH)
+df = load(DATA_PATH)
 print("Missing values in each column:")
 print(df.isnull().sum())
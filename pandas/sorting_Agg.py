@@ -1,13 +1,16 @@
-import pandas as pd
+from data_loader import load
 
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 
-df = pd.read_csv(DATA_PATH)
+# Number of top-selling rows to print
+TOP_K = 20
 
-# Sorting
-sorted_df = df.sort_values("Units_Sold", ascending=False)
-print("Products sorted by Units Sold (High to Low):")
+df = load(DATA_PATH)
+
+# Sorting (only the top rows are shown, so a partial selection is enough)
+sorted_df = df.nlargest(TOP_K, "Units_Sold")
+print(f"Top {TOP_K} products by Units Sold (High to Low):")
 print(sorted_df)
 
 
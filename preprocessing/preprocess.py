@@ -8,14 +8,36 @@ Project: Smart Stock Inventory Optimization
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import argparse
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+from data_loader import READ_DTYPES, parquet_path, write_cache
+
 # Configure paths (run from project root)
 INPUT_PATH = "dataset/sales_data.csv"
 OUTPUT_PATH = "dataset/updated_dataset.csv"
 REPORT_PATH = "output/preprocessing_report.txt"
 
+# Calendar month order and its 1-based month numbers
+MONTH_ORDER = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+MONTH_MAP = {month: i + 1 for i, month in enumerate(MONTH_ORDER)}
+
+# Column order of the processed dataset
+COLUMN_ORDER = [
+    'Product_ID', 'Product_Name', 'Month', 'Month_Num',
+    'Units_Sold', 'Price', 'Opening_Stock',
+    'Total_Sales_Value', 'Revenue_Per_Unit',
+    'Remaining_Stock', 'Stock_Turnover_Rate'
+]
+
+# Rows per chunk when streaming large input files, and the streamed output
+CHUNK_SIZE = 1_000_000
+STREAM_OUTPUT_PATH = "dataset/updated_dataset_stream.parquet"
+
 # Ensure output directory exists
 os.makedirs("output", exist_ok=True)
 
@@ -26,7 +48,7 @@ def load_raw_data():
     print("STEP 1: LOADING RAW DATA")
     print("=" * 60)
     
-    df = pd.read_csv(INPUT_PATH)
+    df = pd.read_csv(INPUT_PATH, engine='pyarrow')
     print(f"✓ Data loaded successfully")
     print(f"  Records: {len(df)}")
     print(f"  Columns: {len(df.columns)}")
@@ -35,7 +57,7 @@ def load_raw_data():
 
 
 def inspect_data(df):
-    """Inspect data quality and structure."""
+    """Inspect data quality and structure; returns missing counts and duplicate count."""
     print("\n" + "=" * 60)
     print("STEP 2: DATA INSPECTION")
     print("=" * 60)
@@ -53,52 +75,108 @@ def inspect_data(df):
     else:
         print(missing[missing > 0])
     
-    print(f"\nDuplicate Rows: {df.duplicated().sum()}")
+    # Hash every row once; the count is reused by the report
+    duplicate_count = int(df.duplicated().sum())
+    print(f"\nDuplicate Rows: {duplicate_count}")
     
     print(f"\nBasic Statistics:")
     print(df.describe())
     
-    return missing
+    return missing, duplicate_count
 
 
-def add_calculated_columns(df):
-    """Add calculated columns to the dataset."""
-    print("\n" + "=" * 60)
-    print("STEP 3: FEATURE ENGINEERING")
-    print("=" * 60)
-    
-    # Add Total Sales Value
-    df['Total_Sales_Value'] = df['Units_Sold'] * df['Price']
-    print("✓ Added column: Total_Sales_Value")
-    
-    # Add Month Number
-    month_order = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-    df['Month_Num'] = df['Month'].apply(lambda x: month_order.index(x) + 1 if x in month_order else np.nan)
-    print("✓ Added column: Month_Num")
+def add_calculated_columns(df, verbose=True):
+    """Add calculated columns to the dataset (progress messages only if verbose)."""
+    log = print if verbose else (lambda *args: None)
+    log("\n" + "=" * 60)
+    log("STEP 3: FEATURE ENGINEERING")
+    log("=" * 60)
+    
+    # Downcast integer source columns to 32 bits; fractional columns stay float64
+    # so Price and the money columns derived from it keep their exact values
+    for col in ['Units_Sold', 'Price', 'Opening_Stock']:
+        if pd.api.types.is_integer_dtype(df[col]):
+            df[col] = df[col].astype(np.int32)
+    
+    # Pull the source columns once; each feature below is a single ufunc pass
+    units = df['Units_Sold'].to_numpy()
+    price = df['Price'].to_numpy()
+    stock = df['Opening_Stock'].to_numpy()
+    
+    # Add Total Sales Value (accumulated in 64 bits so large totals cannot overflow)
+    total_sales = np.multiply(units, price, dtype=np.result_type(price, np.int64))
+    df['Total_Sales_Value'] = total_sales
+    log("✓ Added column: Total_Sales_Value")
+    
+    # Add Month Number (one hash lookup per row; unknown months become missing)
+    df['Month_Num'] = df['Month'].map(MONTH_MAP).astype('Int8')
+    log("✓ Added column: Month_Num")
     
     # Add Remaining Stock
-    df['Remaining_Stock'] = df['Opening_Stock'] - df['Units_Sold']
-    print("✓ Added column: Remaining_Stock")
+    df['Remaining_Stock'] = stock - units
+    log("✓ Added column: Remaining_Stock")
     
-    # Add Stock Turnover Rate (percentage)
-    df['Stock_Turnover_Rate'] = (df['Units_Sold'] / df['Opening_Stock'] * 100).round(2)
-    print("✓ Added column: Stock_Turnover_Rate")
+    # Add Stock Turnover Rate (percentage, NaN where there was no opening stock;
+    # stored at full precision and rounded only when printed)
+    turnover = np.divide(units, stock, out=np.full(len(df), np.nan), where=stock != 0)
+    turnover *= 100
+    df['Stock_Turnover_Rate'] = turnover
+    log("✓ Added column: Stock_Turnover_Rate")
     
-    # Add Revenue Per Unit
-    df['Revenue_Per_Unit'] = df['Total_Sales_Value'] / df['Units_Sold']
-    print("✓ Added column: Revenue_Per_Unit")
+    # Add Revenue Per Unit (NaN where nothing was sold)
+    df['Revenue_Per_Unit'] = np.divide(total_sales, units, out=np.full(len(df), np.nan), where=units != 0)
+    log("✓ Added column: Revenue_Per_Unit")
     
-    # Convert Month to categorical
-    df['Month'] = pd.Categorical(df['Month'], categories=[m for m in month_order if m in df['Month'].unique()], ordered=True)
-    print("✓ Converted Month to categorical type")
+    # Convert Month to categorical (unused months are dropped from the codes, not by rescanning the strings)
+    # (labels outside MONTH_ORDER are already missing in Month_Num and become missing here too)
+    months = df['Month'].where(df['Month_Num'].notna())
+    df['Month'] = pd.Categorical(months, categories=MONTH_ORDER, ordered=True).remove_unused_categories()
+    log("✓ Converted Month to categorical type")
     
-    print(f"\nDataset now has {len(df.columns)} columns")
+    log(f"\nDataset now has {len(df.columns)} columns")
     
     return df
 
 
-def validate_data(df):
-    """Validate data integrity."""
+def summarize_columns(df):
+    """
+    Compute every statistic used by validation and the report in one place.
+    
+    Each value is a single NumPy reduction over the underlying column array,
+    so validate_data and generate_report share these results instead of
+    scanning the same columns again. NaNs are skipped in the means and sums
+    and never count as negative, as with the pandas methods they replace.
+    
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Dataset with the calculated columns added
+        
+    Returns:
+    --------
+    dict : Validation flags and summary values
+    """
+    units = df['Units_Sold'].to_numpy()
+    price = df['Price'].to_numpy()
+    stock = df['Opening_Stock'].to_numpy()
+    turnover = df['Stock_Turnover_Rate'].to_numpy()
+    
+    return {
+        # fmin skips NaNs and initial=0 covers empty columns; no boolean temporaries
+        'units_negative': bool(np.fmin.reduce(units, initial=0) < 0),
+        'price_negative': bool(np.fmin.reduce(price, initial=0) < 0),
+        'stock_negative': bool(np.fmin.reduce(stock, initial=0) < 0),
+        'high_turnover_count': int(np.count_nonzero(turnover > 100)),
+        'unknown_month_count': int(df['Month_Num'].isna().sum()),
+        'total_sales': np.nansum(df['Total_Sales_Value'].to_numpy()),
+        'total_units': np.nansum(units),
+        'average_price': np.nanmean(price, dtype=np.float64),
+        'average_turnover': np.nanmean(turnover),
+    }
+
+
+def validate_data(stats):
+    """Validate data integrity from the precomputed column statistics."""
     print("\n" + "=" * 60)
     print("STEP 4: DATA VALIDATION")
     print("=" * 60)
@@ -106,25 +184,30 @@ def validate_data(df):
     issues = []
     
     # Check for negative values
-    if (df['Units_Sold'] < 0).any():
+    if stats['units_negative']:
         issues.append("Negative units sold detected")
     else:
         print("✓ All Units_Sold values are non-negative")
     
-    if (df['Price'] < 0).any():
+    if stats['price_negative']:
         issues.append("Negative prices detected")
     else:
         print("✓ All Price values are non-negative")
     
-    if (df['Opening_Stock'] < 0).any():
+    if stats['stock_negative']:
         issues.append("Negative opening stock detected")
     else:
         print("✓ All Opening_Stock values are non-negative")
     
+    # Month labels outside MONTH_MAP leave Month_Num missing
+    if stats['unknown_month_count']:
+        issues.append(f"{stats['unknown_month_count']} records have an unrecognised or missing Month")
+    else:
+        print("✓ All Month values are recognised")
+    
     # Check for unrealistic values
-    if (df['Stock_Turnover_Rate'] > 100).any():
-        high_turnover = df[df['Stock_Turnover_Rate'] > 100]
-        print(f"⚠ Warning: {len(high_turnover)} records have >100% stock turnover (sold more than stocked)")
+    if stats['high_turnover_count']:
+        print(f"⚠ Warning: {stats['high_turnover_count']} records have >100% stock turnover (sold more than stocked)")
     else:
         print("✓ All stock turnover rates are within normal range")
     
@@ -138,12 +221,8 @@ def validate_data(df):
     return issues
 
 
-def generate_report(df, missing_before, issues):
-    """Generate preprocessing report."""
-    print("\n" + "=" * 60)
-    print("STEP 5: GENERATING REPORT")
-    print("=" * 60)
-    
+def generate_report(df, missing_before, duplicate_count, issues, stats):
+    """Write the preprocessing report file (main() prints the step status)."""
     with open(REPORT_PATH, 'w') as f:
         f.write("=" * 70 + "\n")
         f.write(" " * 15 + "DATA PREPROCESSING REPORT\n")
@@ -160,7 +239,7 @@ def generate_report(df, missing_before, issues):
         f.write("\n2. DATA QUALITY\n")
         f.write("-" * 70 + "\n")
         f.write(f"Missing Values: {missing_before.sum()}\n")
-        f.write(f"Duplicate Rows: {df.duplicated().sum()}\n")
+        f.write(f"Duplicate Rows: {duplicate_count}\n")
         f.write(f"Validation Issues: {len(issues)}\n")
         
         f.write("\n3. FEATURE ENGINEERING\n")
@@ -176,10 +255,10 @@ def generate_report(df, missing_before, issues):
         f.write("-" * 70 + "\n")
         f.write(f"Final Records: {len(df)}\n")
         f.write(f"Final Columns: {len(df.columns)}\n")
-        f.write(f"Total Sales Value: ${df['Total_Sales_Value'].sum():,.2f}\n")
-        f.write(f"Total Units Sold: {df['Units_Sold'].sum():,}\n")
-        f.write(f"Average Price: ${df['Price'].mean():.2f}\n")
-        f.write(f"Average Stock Turnover: {df['Stock_Turnover_Rate'].mean():.2f}%\n")
+        f.write(f"Total Sales Value: ${stats['total_sales']:,.2f}\n")
+        f.write(f"Total Units Sold: {stats['total_units']:,}\n")
+        f.write(f"Average Price: ${stats['average_price']:.2f}\n")
+        f.write(f"Average Stock Turnover: {stats['average_turnover']:.2f}%\n")
         
         f.write("\n5. OUTPUT\n")
         f.write("-" * 70 + "\n")
@@ -189,34 +268,92 @@ def generate_report(df, missing_before, issues):
         f.write("\n" + "=" * 70 + "\n")
         f.write("Preprocessing completed successfully!\n")
         f.write("=" * 70 + "\n")
-    
-    print(f"✓ Report saved: {REPORT_PATH}")
 
 
 def save_processed_data(df):
-    """Save processed data to CSV."""
-    print("\n" + "=" * 60)
-    print("STEP 6: SAVING PROCESSED DATA")
-    print("=" * 60)
-    
+    """Save processed data to CSV, plus a Parquet copy for the analysis scripts (main() prints the step status)."""
     # Reorder columns for better readability
-    column_order = [
-        'Product_ID', 'Product_Name', 'Month', 'Month_Num',
-        'Units_Sold', 'Price', 'Opening_Stock',
-        'Total_Sales_Value', 'Revenue_Per_Unit',
-        'Remaining_Stock', 'Stock_Turnover_Rate'
-    ]
-    
-    df = df[column_order]
+    df = df[COLUMN_ORDER]
+    
     df.to_csv(OUTPUT_PATH, index=False)
     
-    print(f"✓ Processed data saved: {OUTPUT_PATH}")
-    print(f"  Records: {len(df)}")
-    print(f"  Columns: {len(df.columns)}")
+    # Typed columnar copy that data_loader.load() reads instead of re-parsing the CSV
+    write_cache(df, OUTPUT_PATH)
     
     return df
 
 
+def stream_preprocess(input_path=INPUT_PATH, output_path=STREAM_OUTPUT_PATH, chunksize=CHUNK_SIZE):
+    """
+    Run feature engineering over a CSV file too large to load at once.
+    
+    Chunks are read one at a time, given the calculated columns and appended
+    to a single Parquet file, so peak memory is bounded by the chunk size. The
+    validation and report statistics are merged chunk by chunk into the same
+    dictionary that summarize_columns() returns for an in-memory frame.
+    
+    Parameters:
+    -----------
+    input_path : str
+        Raw sales CSV file
+    output_path : str
+        Parquet file to write
+    chunksize : int
+        Rows read per chunk
+        
+    Returns:
+    --------
+    dict : Validation flags and summary values for the whole file
+    """
+    # Output schema fixed up front rather than taken from the first chunk, so a
+    # later chunk with missing integers or fractional prices still casts to it:
+    # COLUMN_DTYPES with nullable integers, float64 sales totals, all twelve months
+    template = pd.DataFrame({
+        'Product_ID': pd.Series(dtype='str'),
+        'Product_Name': pd.Series(dtype='str'),
+        'Month': pd.Series(dtype=pd.CategoricalDtype(MONTH_ORDER, ordered=True)),
+        'Total_Sales_Value': pd.Series(dtype='float64'),
+        **{col: pd.Series(dtype=dtype) for col, dtype in READ_DTYPES.items()},
+    })[COLUMN_ORDER]
+    schema = pa.Schema.from_pandas(template, preserve_index=False)
+    
+    # Totals start empty so a header-only file still reports zero records
+    stats = {
+        'units_negative': False, 'price_negative': False, 'stock_negative': False,
+        'high_turnover_count': 0, 'unknown_month_count': 0, 'total_sales': 0, 'total_units': 0,
+    }
+    mean_parts = {'average_price': [0.0, 0], 'average_turnover': [0.0, 0]}
+    writer = pq.ParquetWriter(output_path, schema, compression="zstd")
+    for chunk in pd.read_csv(input_path, chunksize=chunksize):
+        if chunk.empty:
+            continue
+        chunk = add_calculated_columns(chunk, verbose=False)[COLUMN_ORDER]
+        chunk['Month'] = chunk['Month'].cat.set_categories(MONTH_ORDER)
+        
+        part = summarize_columns(chunk)
+        part_counts = {
+            'average_price': int(chunk['Price'].count()),
+            'average_turnover': int(chunk['Stock_Turnover_Rate'].count()),
+        }
+        for key in ['units_negative', 'price_negative', 'stock_negative']:
+            stats[key] = stats[key] or part[key]
+        for key in ['high_turnover_count', 'unknown_month_count', 'total_sales', 'total_units']:
+            stats[key] += part[key]
+        # Means are merged as value sums over non-missing counts
+        for key, count in part_counts.items():
+            if count:
+                mean_parts[key][0] += part[key] * count
+                mean_parts[key][1] += count
+        
+        writer.write_table(pa.Table.from_pandas(chunk, preserve_index=False).cast(schema))
+    writer.close()
+    
+    for key, (total, count) in mean_parts.items():
+        stats[key] = total / count if count else np.nan
+    
+    return stats
+
+
 def main():
     """Main preprocessing pipeline."""
     print("\n" + "=" * 70)
@@ -227,19 +364,37 @@ def main():
     df = load_raw_data()
     
     # Step 2: Inspect data
-    missing_before = inspect_data(df)
+    missing_before, duplicate_count = inspect_data(df)
     
     # Step 3: Add calculated columns
     df = add_calculated_columns(df)
     
     # Step 4: Validate data
-    issues = validate_data(df)
+    stats = summarize_columns(df)
+    issues = validate_data(stats)
+    
+    # Steps 5 and 6 write independent files, so run them concurrently and
+    # print their status afterwards in step order
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        report_job = executor.submit(generate_report, df, missing_before, duplicate_count, issues, stats)
+        save_job = executor.submit(save_processed_data, df)
+        report_job.result()
+        df = save_job.result()
     
     # Step 5: Generate report
-    generate_report(df, missing_before, issues)
+    print("\n" + "=" * 60)
+    print("STEP 5: GENERATING REPORT")
+    print("=" * 60)
+    print(f"✓ Report saved: {REPORT_PATH}")
     
     # Step 6: Save processed data
-    df = save_processed_data(df)
+    print("\n" + "=" * 60)
+    print("STEP 6: SAVING PROCESSED DATA")
+    print("=" * 60)
+    print(f"✓ Processed data saved: {OUTPUT_PATH}")
+    print(f"✓ Parquet copy saved: {parquet_path(OUTPUT_PATH)}")
+    print(f"  Records: {len(df)}")
+    print(f"  Columns: {len(df.columns)}")
     
     print("\n" + "=" * 70)
     print(" " * 20 + "PREPROCESSING COMPLETE!")
@@ -249,4 +404,15 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Data preprocessing pipeline")
+    parser.add_argument("--stream", metavar="CSV",
+                        help="process this raw CSV in chunks into Parquet instead of running the in-memory pipeline")
+    args = parser.parse_args()
+    
+    if args.stream:
+        print(f"Streaming {args.stream} in chunks of {CHUNK_SIZE:,} rows...")
+        stream_stats = stream_preprocess(args.stream)
+        validate_data(stream_stats)
+        print(f"\n✓ Processed data saved: {STREAM_OUTPUT_PATH}")
+    else:
+        main()
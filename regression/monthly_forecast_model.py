@@ -7,12 +7,11 @@ Project: Smart Stock Inventory Optimization
 """
 
 import pandas as pd
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import mean_squared_error, r2_score
 import numpy as np
-import matplotlib.pyplot as plt
 import os
 
+from data_loader import load
+
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 OUTPUT_DIR = "output"
@@ -20,19 +19,66 @@ OUTPUT_DIR = "output"
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
+class TrendModel:
+    """
+    Straight-line trend y = intercept_ + coef_[0] * x fitted by least squares.
+    
+    Exposes the coef_/intercept_/predict interface of sklearn's
+    LinearRegression for a single feature, without its input validation
+    and LAPACK solve, which dominate the cost of a fit on a handful of points.
+    """
+    
+    def __init__(self, slope, intercept):
+        self.coef_ = np.array([slope])
+        self.intercept_ = intercept
+    
+    @classmethod
+    def fit(cls, x, y):
+        """
+        Fit the trend in closed form from centred sums.
+        
+        Parameters:
+        -----------
+        x : array-like
+            Feature values of shape (n,) or (n, 1)
+        y : array-like
+            Target values of shape (n,)
+            
+        Returns:
+        --------
+        TrendModel : Fitted model
+        """
+        x = np.asarray(x, dtype=np.float64).ravel()
+        y = np.asarray(y, dtype=np.float64)
+        x_centred = x - x.mean()
+        slope = np.dot(x_centred, y - y.mean()) / np.dot(x_centred, x_centred)
+        return cls(slope, y.mean() - slope * x.mean())
+    
+    def predict(self, X):
+        """Evaluate the trend at X (shape (n,) or (n, 1))."""
+        return self.intercept_ + self.coef_[0] * np.asarray(X, dtype=np.float64).ravel()
+
+
 def prepare_monthly_data():
     """Prepare monthly aggregated data."""
     print("\n" + "=" * 60)
     print("PREPARING MONTHLY DATA")
     print("=" * 60)
     
-    df = pd.read_csv(DATA_PATH)
-    
-    # Aggregate by month
-    monthly_sales = df.groupby('Month_Num').agg({
-        'Total_Sales_Value': 'sum',
-        'Units_Sold': 'sum'
-    }).reset_index()
+    df = load(DATA_PATH, columns=['Month_Num', 'Total_Sales_Value', 'Units_Sold'])
+    
+    # Aggregate by month: Month_Num is a small dense integer key, so each
+    # total is one bincount pass instead of a hash groupby. Rows with an
+    # unrecognised month (NA Month_Num) are left out, as groupby drops NA keys,
+    # and missing values add nothing to a total, as in groupby's sum
+    known = df['Month_Num'].notna().to_numpy()
+    month = df.loc[known, 'Month_Num'].to_numpy(dtype=np.int64)
+    months = np.flatnonzero(np.bincount(month))
+    monthly_sales = pd.DataFrame({'Month_Num': months})
+    for col in ['Total_Sales_Value', 'Units_Sold']:
+        values = df.loc[known, col].to_numpy(dtype=np.float64, na_value=0.0)
+        totals = np.bincount(month, weights=values)[months]
+        monthly_sales[col] = totals.astype(np.int64) if pd.api.types.is_integer_dtype(df[col]) else totals
     
     print(f"✓ Monthly data prepared")
     print(f"\nMonthly Sales Summary:")
@@ -50,13 +96,14 @@ def train_forecasting_model(monthly_sales):
     X = monthly_sales[['Month_Num']]
     y = monthly_sales['Total_Sales_Value']
     
-    model = LinearRegression()
-    model.fit(X, y)
+    model = TrendModel.fit(X, y)
     
-    # Model performance
-    y_pred = model.predict(X)
-    r2 = r2_score(y, y_pred)
-    rmse = np.sqrt(mean_squared_error(y, y_pred))
+    # Model performance (R² and RMSE from the residuals; no sklearn import needed)
+    y_true = y.to_numpy(dtype=np.float64)
+    residuals = y_true - model.predict(X)
+    ss_res = np.dot(residuals, residuals)
+    r2 = 1 - ss_res / np.sum((y_true - y_true.mean()) ** 2)
+    rmse = np.sqrt(ss_res / len(y_true))
     
     print(f"✓ Model trained successfully")
     print(f"\nModel Coefficients:")
@@ -82,22 +129,26 @@ def forecast_future_months(model, monthly_sales):
     print("=" * 60)
     
     # Forecast next 6 months (July to December)
-    future_months = pd.DataFrame({'Month_Num': [7, 8, 9, 10, 11, 12]})
+    future_months = np.arange(7, 13)
     month_names = ['July', 'August', 'September', 'October', 'November', 'December']
     
-    predictions = model.predict(future_months)
+    # Evaluate the fitted line directly
+    predictions = model.intercept_ + model.coef_[0] * future_months
     
     print("\nForecast Results:")
     print("-" * 60)
     
     forecast_df = pd.DataFrame({
-        'Month_Num': future_months['Month_Num'].values,
+        'Month_Num': future_months,
         'Month': month_names,
         'Predicted_Sales_Value': predictions
     })
     
-    for idx, row in forecast_df.iterrows():
-        print(f"  {row['Month']:12} (Month {row['Month_Num']:2}): ${row['Predicted_Sales_Value']:>12,.2f}")
+    lines = [
+        f"  {name:12} (Month {month:2}): ${value:>12,.2f}"
+        for month, name, value in zip(forecast_df['Month_Num'].to_numpy(), forecast_df['Month'].to_numpy(), predictions)
+    ]
+    print("\n".join(lines))
     
     # Calculate total forecast
     total_forecast = predictions.sum()
@@ -113,6 +164,8 @@ def forecast_future_months(model, monthly_sales):
 
 def visualize_forecast(monthly_sales, model, forecast_df):
     """Create visualization of forecast."""
+    import matplotlib.pyplot as plt
+    
     print("\n" + "=" * 60)
     print("GENERATING VISUALIZATIONS")
     print("=" * 60)
@@ -135,9 +188,8 @@ def visualize_forecast(monthly_sales, model, forecast_df):
              label='Forecast', linewidth=2, markersize=8, color='#A23B72')
     
     # Trend line
-    all_months_values = np.array(list(historical_months) + list(future_months))
-    all_months_df = pd.DataFrame({'Month_Num': all_months_values})
-    trend = model.predict(all_months_df)
+    all_months_values = np.concatenate([historical_months, future_months])
+    trend = model.intercept_ + model.coef_[0] * all_months_values
     plt.plot(all_months_values, trend, ':', 
              label='Trend Line', linewidth=1.5, color='#F18F01', alpha=0.7)
     
@@ -172,9 +224,12 @@ def save_forecast_report(forecast_df, monthly_sales, model, r2, rmse):
         
         f.write("1. HISTORICAL DATA SUMMARY (Jan-Jun)\n")
         f.write("-" * 70 + "\n")
-        for idx, row in monthly_sales.iterrows():
-            month_name = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'][idx]
-            f.write(f"  Month {row['Month_Num']} ({month_name}): ${row['Total_Sales_Value']:>12,.2f}\n")
+        f.write("".join(
+            f"  Month {month} ({name}): ${value:>12,.2f}\n"
+            for name, month, value in zip(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
+                                          monthly_sales['Month_Num'].to_numpy(),
+                                          monthly_sales['Total_Sales_Value'].to_numpy())
+        ))
         f.write(f"  Total H1:          ${monthly_sales['Total_Sales_Value'].sum():>12,.2f}\n")
         f.write(f"  Average/Month:     ${monthly_sales['Total_Sales_Value'].mean():>12,.2f}\n")
         
@@ -188,8 +243,12 @@ def save_forecast_report(forecast_df, monthly_sales, model, r2, rmse):
         
         f.write("\n3. FORECAST (Jul-Dec)\n")
         f.write("-" * 70 + "\n")
-        for idx, row in forecast_df.iterrows():
-            f.write(f"  Month {row['Month_Num']:2} ({row['Month']:9}): ${row['Predicted_Sales_Value']:>12,.2f}\n")
+        f.write("".join(
+            f"  Month {month:2} ({name:9}): ${value:>12,.2f}\n"
+            for month, name, value in zip(forecast_df['Month_Num'].to_numpy(),
+                                          forecast_df['Month'].to_numpy(),
+                                          forecast_df['Predicted_Sales_Value'].to_numpy())
+        ))
         f.write(f"  Total H2:          ${forecast_df['Predicted_Sales_Value'].sum():>12,.2f}\n")
         f.write(f"  Average/Month:     ${forecast_df['Predicted_Sales_Value'].mean():>12,.2f}\n")
         
@@ -6,17 +6,16 @@ Author: Toshit Dwivedi
 Project: Smart Stock Inventory Optimization
 """
 
-from sklearn.linear_model import LinearRegression
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
 import os
 
+from data_loader import load
+
 # Configure paths (run from project root)
 DATA_PATH = "dataset/updated_dataset.csv"
 OUTPUT_DIR = "output"
+CACHE_DIR = ".cache"
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -27,7 +26,7 @@ def load_and_prepare_data():
     print("LOADING AND PREPARING DATA")
     print("=" * 60)
     
-    df = pd.read_csv(DATA_PATH)
+    df = load(DATA_PATH, columns=['Price', 'Opening_Stock', 'Units_Sold'])
     print(f"✓ Data loaded: {len(df)} records")
     
     # Features and target
@@ -40,16 +39,53 @@ def load_and_prepare_data():
     return X, y, df
 
 
+def split_indices(n_samples, test_size=0.2, random_state=42):
+    """
+    Return the train/test row positions of a shuffled split, cached on disk.
+    
+    The positions depend only on the sample count, test size and seed, so
+    they are stored in an .npz file keyed by those three values and reused
+    on later runs. The split is then a positional gather on the current data,
+    which stays correct even if the dataset changes without changing length.
+    
+    Parameters:
+    -----------
+    n_samples : int
+        Number of rows to split
+    test_size : float
+        Fraction of rows held out for testing
+    random_state : int
+        Seed for the shuffle
+        
+    Returns:
+    --------
+    tuple : (train_positions, test_positions) as integer arrays
+    """
+    cache_path = os.path.join(CACHE_DIR, f"split_n{n_samples}_test{test_size}_seed{random_state}.npz")
+    if os.path.exists(cache_path):
+        with np.load(cache_path) as cached:
+            return cached["train"], cached["test"]
+    
+    from sklearn.model_selection import train_test_split
+    
+    train, test = train_test_split(np.arange(n_samples), test_size=test_size, random_state=random_state)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    np.savez(cache_path, train=train, test=test)
+    return train, test
+
+
 def train_model(X, y):
     """Train linear regression model."""
+    from sklearn.linear_model import LinearRegression
+    
     print("\n" + "=" * 60)
     print("TRAINING MODEL")
     print("=" * 60)
     
-    # Split data
-    X_train, X_test, y_train, y_test = train_test_split(
-        X, y, test_size=0.2, random_state=42
-    )
+    # Split data (same rows as train_test_split with this seed)
+    train, test = split_indices(len(X), test_size=0.2, random_state=42)
+    X_train, X_test = X.iloc[train], X.iloc[test]
+    y_train, y_test = y.iloc[train], y.iloc[test]
     
     print(f"Training set: {len(X_train)} samples")
     print(f"Testing set: {len(X_test)} samples")
@@ -69,6 +105,8 @@ def train_model(X, y):
 
 def evaluate_model(model, X_train, X_test, y_train, y_test):
     """Evaluate model performance."""
+    from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
+    
     print("\n" + "=" * 60)
     print("MODEL EVALUATION")
     print("=" * 60)
@@ -111,6 +149,8 @@ def evaluate_model(model, X_train, X_test, y_train, y_test):
 
 def visualize_predictions(y_test, y_test_pred):
     """Create visualization of predictions."""
+    import matplotlib.pyplot as plt
+    
     print("\n" + "=" * 60)
     print("GENERATING VISUALIZATIONS")
     print("=" * 60)
@@ -153,34 +193,19 @@ def make_predictions(model):
     print("MAKING PREDICTIONS")
     print("=" * 60)
     
-    # Scenario 1
-    new_data_1 = pd.DataFrame({'Price': [50], 'Opening_Stock': [150]})
-    predicted_1 = model.predict(new_data_1)[0]
-    print(f"\nScenario 1:")
-    print(f"  Price: $50, Opening Stock: 150")
-    print(f"  → Predicted Units Sold: {np.round(predicted_1, 0):.0f}")
-    
-    # Scenario 2
-    new_data_2 = pd.DataFrame({'Price': [75], 'Opening_Stock': [200]})
-    predicted_2 = model.predict(new_data_2)[0]
-    print(f"\nScenario 2:")
-    print(f"  Price: $75, Opening Stock: 200")
-    print(f"  → Predicted Units Sold: {np.round(predicted_2, 0):.0f}")
-    
-    # Scenario 3
-    new_data_3 = pd.DataFrame({'Price': [30], 'Opening_Stock': [250]})
-    predicted_3 = model.predict(new_data_3)[0]
-    print(f"\nScenario 3:")
-    print(f"  Price: $30, Opening Stock: 250")
-    print(f"  → Predicted Units Sold: {np.round(predicted_3, 0):.0f}")
-    
-    # Save predictions
+    # All scenarios go through a single batched predict call
     scenarios = pd.DataFrame({
         'Scenario': ['Scenario 1', 'Scenario 2', 'Scenario 3'],
         'Price': [50, 75, 30],
-        'Opening_Stock': [150, 200, 250],
-        'Predicted_Units_Sold': [predicted_1, predicted_2, predicted_3]
+        'Opening_Stock': [150, 200, 250]
     })
+    scenarios['Predicted_Units_Sold'] = model.predict(scenarios[['Price', 'Opening_Stock']])
+    
+    for name, price, stock, predicted in zip(scenarios['Scenario'], scenarios['Price'],
+                                             scenarios['Opening_Stock'], scenarios['Predicted_Units_Sold']):
+        print(f"\n{name}:")
+        print(f"  Price: ${price}, Opening Stock: {stock}")
+        print(f"  → Predicted Units Sold: {np.round(predicted, 0):.0f}")
     
     output_path = os.path.join(OUTPUT_DIR, "prediction_scenarios.csv")
     scenarios.to_csv(output_path, index=False)
@@ -0,0 +1,31 @@
+"""
+Script Runner
+-------------
+Runs one of the project scripts with the project root importable, so the
+scripts can import the shared data_loader without touching sys.path.
+Author: Toshit Dwivedi
+Project: Smart Stock Inventory Optimization
+
+Usage (from the project root):
+    python run.py pandas/groupby.py
+    python run.py numpy/missing_data_handler.py --stream dataset/updated_dataset.csv
+"""
+
+import runpy
+import sys
+
+
+def main():
+    """Run the script named on the command line as __main__, passing on its arguments."""
+    if len(sys.argv) < 2:
+        sys.exit("Usage: python run.py <script.py> [arguments...]")
+
+    # The scripts live in folders named numpy/ and pandas/, which would shadow the
+    # real libraries as packages, so they are run by path rather than with -m.
+    # This file's folder (the project root) is already first on sys.path.
+    sys.argv = sys.argv[1:]
+    runpy.run_path(sys.argv[0], run_name="__main__")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Run All Analyses
+----------------
+Runs the NumPy and Pandas analysis scripts in one process, parsing the dataset once.
+Author: Toshit Dwivedi
+Project: Smart Stock Inventory Optimization
+"""
+
+import importlib.util
+import os
+
+from data_loader import load_dataset
+
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# (script, entry point) pairs in execution order; each entry point accepts df
+ANALYSES = [
+    ("numpy/statistical_analysis.py", "main"),
+    ("numpy/array_operations.py", "demonstrate_array_operations"),
+    ("numpy/missing_data_handler.py", "demonstrate_missing_data_handling"),
+    ("pandas/data_manipulation.py", "main"),
+    ("pandas/advanced_analysis.py", "main"),
+]
+
+
+def import_script(path):
+    """
+    Import an analysis script by file path.
+    
+    The scripts live in folders named numpy/ and pandas/, which would shadow
+    the real libraries if imported as packages, so they are loaded by path.
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, os.path.join(PROJECT_ROOT, path))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def main():
+    """Main execution function."""
+    df = load_dataset()
+    print(f"\n✓ Dataset loaded once: {len(df)} records")
+    
+    for path, entry_point in ANALYSES:
+        module = import_script(path)
+        getattr(module, entry_point)(df=df)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,12 +7,15 @@ Project: Smart Stock Inventory Optimization
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import os
 
+from build_parquet import DASHBOARD_PATH, DATA_PATH, build
+
 # Page configuration
 st.set_page_config(
     page_title="SmartStock Dashboard",
@@ -43,20 +46,232 @@ st.markdown("""
 # Load data
 @st.cache_data
 def load_data():
-    """Load sales data with caching."""
-    # Run from project root
-    file_path = "dataset/updated_dataset.csv"
-    df = pd.read_csv(file_path)
+    """
+    Load sales data with caching (derived columns are precomputed by build_parquet.py).
+    
+    Returns:
+    --------
+    tuple : (DataFrame indexed by Product_Name and Month, product names in
+        dataset order, months in calendar order)
+    """
+    # Run from project root; rebuild the Parquet file if it is missing or older than the CSV
+    if os.path.exists(DASHBOARD_PATH) and os.path.getmtime(DASHBOARD_PATH) >= os.path.getmtime(DATA_PATH):
+        df = pd.read_parquet(DASHBOARD_PATH, engine="pyarrow")
+    else:
+        df = build()
+    
+    # The sidebar options are fixed for the cached data, so list them once here
+    products = tuple(df["Product_Name"].unique())
+    months = tuple(df["Month"].cat.categories)
+    
+    # Index by the filter keys so selections are label lookups instead of isin masks
+    return df.set_index(["Product_Name", "Month"]), products, months
+
+def select(data, products, months):
+    """Rows for the selected products and months, with the keys back as columns."""
+    # The default view selects everything, which needs no lookup at all
+    # (multiselect values are distinct, so matching counts means all selected)
+    if len(products) == data.index.levels[0].size and len(months) == data.index.levels[1].size:
+        return data.reset_index()
+    
+    # get_locs returns positions in selection order; sorting them keeps dataset order
+    # (so charts show months in calendar order however they were picked)
+    positions = data.index.get_locs([list(products), list(months)])
+    return data.iloc[np.sort(positions)].reset_index()
+
+@st.cache_data
+def product_agg(filter_key):
+    """
+    Per-product aggregates for the current filter, computed in one groupby pass.
+    
+    Parameters:
+    -----------
+    filter_key : tuple
+        (selected products, selected months), each a sorted tuple
     
-    # Add calculated columns
-    df["Sales_to_Stock_Ratio"] = df["Units_Sold"] / df["Opening_Stock"]
-    df["Stockout_Risk"] = df["Sales_to_Stock_Ratio"] > 0.7
-    df["Stock_Efficiency"] = (df["Units_Sold"] / df["Opening_Stock"] * 100).round(2)
+    Returns:
+    --------
+    pandas.DataFrame : Total sales, total units, mean opening stock, mean
+        stock efficiency and mean revenue per unit per product
+    """
+    products, months = filter_key
+    data = select(load_data()[0], products, months)
     
-    return df
+    return data.groupby("Product_Name", observed=True).agg(
+        Total_Sales_Value=("Total_Sales_Value", "sum"),
+        Units_Sold=("Units_Sold", "sum"),
+        Opening_Stock=("Opening_Stock", "mean"),
+        Stock_Efficiency=("Stock_Efficiency", "mean"),
+        Revenue_Per_Unit=("Revenue_Per_Unit", "mean")
+    )
+
+# Chart builders: cached per filter selection so reruns reuse the finished figures.
+# The underscore-prefixed frames are derived from the static dataset and the key,
+# so Streamlit hashes only the key.
+@st.cache_data
+def top_products_chart(filter_key, _summary):
+    """Bar chart of the 10 products with the highest sales value."""
+    top_products = _summary["Total_Sales_Value"].nlargest(10).reset_index()
+    fig = px.bar(
+        top_products, 
+        x="Product_Name", 
+        y="Total_Sales_Value",
+        color="Total_Sales_Value",
+        color_continuous_scale="Blues",
+        labels={"Total_Sales_Value": "Sales Value ($)", "Product_Name": "Product"}
+    )
+    fig.update_layout(showlegend=False, height=400)
+    return fig
+
+@st.cache_data
+def monthly_agg(filter_key, _filtered):
+    """Sales value and units sold per month for the selection, in Month_Num order."""
+    return _filtered.groupby("Month_Num", observed=True).agg(
+        Month=("Month", "first"),
+        Total_Sales_Value=("Total_Sales_Value", "sum"),
+        Units_Sold=("Units_Sold", "sum")
+    ).reset_index()
+
+@st.cache_data
+def monthly_sales_chart(filter_key, _monthly):
+    """Donut chart of sales value by month."""
+    fig = px.pie(
+        _monthly,
+        values="Total_Sales_Value",
+        names="Month",
+        hole=0.4,
+        color_discrete_sequence=px.colors.sequential.RdBu
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data
+def sales_trend_chart(filter_key, _product_month_units):
+    """Line chart of units sold per month for each product."""
+    fig = px.line(
+        _product_month_units,
+        x="Month",
+        y="Units_Sold",
+        color="Product_Name",
+        markers=True,
+        labels={"Units_Sold": "Units Sold", "Month": "Month"}
+    )
+    fig.update_layout(height=400, hovermode='x unified')
+    return fig
+
+@st.cache_data
+def price_scatter_chart(filter_key, _filtered):
+    """Scatter of price against units sold, sized by opening stock."""
+    fig = px.scatter(
+        _filtered,
+        x="Price",
+        y="Units_Sold",
+        size="Opening_Stock",
+        color="Product_Name",
+        hover_data=["Month"],
+        labels={"Price": "Price ($)", "Units_Sold": "Units Sold", "Opening_Stock": "Stock"},
+        render_mode="webgl"
+    )
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data
+def units_histogram_chart(filter_key, _filtered):
+    """Histogram of units sold with the mean marked."""
+    # Bin here so only the 20 bar heights are sent to the browser, not every row
+    counts, edges = np.histogram(_filtered["Units_Sold"], bins=20)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color="#1f77b4"
+    ))
+    fig.update_layout(bargap=0, xaxis_title="Units Sold", yaxis_title="count")
+    fig.add_vline(x=_filtered["Units_Sold"].mean(), line_dash="dash", line_color="red",
+                  annotation_text="Mean", annotation_position="top")
+    fig.update_layout(height=400)
+    return fig
+
+@st.cache_data
+def efficiency_heatmap_chart(filter_key, _filtered):
+    """Heatmap of mean stock efficiency per product and month."""
+    pivot = _filtered.groupby(["Product_Name", "Month"], observed=True)["Stock_Efficiency"].mean().unstack("Month")
+    fig = px.imshow(
+        pivot,
+        labels=dict(x="Month", y="Product", color="Efficiency (%)"),
+        color_continuous_scale="RdYlGn",
+        aspect="auto"
+    )
+    fig.update_layout(height=500)
+    return fig
+
+@st.cache_data
+def revenue_treemap_chart(filter_key, _summary):
+    """Treemap of sales value by product."""
+    revenue_data = _summary["Total_Sales_Value"].reset_index()
+    fig = px.treemap(
+        revenue_data,
+        path=["Product_Name"],
+        values="Total_Sales_Value",
+        color="Total_Sales_Value",
+        color_continuous_scale="Greens"
+    )
+    fig.update_layout(height=450)
+    return fig
+
+@st.cache_data
+def revenue_per_unit_chart(filter_key, _summary):
+    """Horizontal bar chart of mean revenue per unit by product."""
+    # Revenue_Per_Unit is precomputed by preprocess.py (NaN where nothing was sold)
+    rpu = _summary["Revenue_Per_Unit"].sort_values(ascending=False).reset_index()
+    fig = px.bar(
+        rpu,
+        x="Revenue_Per_Unit",
+        y="Product_Name",
+        orientation="h",
+        color="Revenue_Per_Unit",
+        color_continuous_scale="Viridis",
+        labels={"Revenue_Per_Unit": "Revenue/Unit ($)", "Product_Name": "Product"}
+    )
+    fig.update_layout(height=450)
+    return fig
+
+@st.cache_data
+def monthly_revenue_chart(filter_key, _monthly):
+    """Monthly revenue bars with units sold on a secondary axis."""
+    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    fig.add_trace(
+        go.Bar(x=_monthly["Month_Num"], y=_monthly["Total_Sales_Value"], 
+               name="Revenue", marker_color="#1f77b4"),
+        secondary_y=False
+    )
+    fig.add_trace(
+        go.Scatter(x=_monthly["Month_Num"], y=_monthly["Units_Sold"],
+                   name="Units", mode="lines+markers", marker_color="orange"),
+        secondary_y=True
+    )
+    fig.update_xaxes(title_text="Month")
+    fig.update_yaxes(title_text="Revenue ($)", secondary_y=False)
+    fig.update_yaxes(title_text="Units Sold", secondary_y=True)
+    fig.update_layout(height=400, hovermode="x unified")
+    return fig
+
+@st.cache_data
+def monthly_comparison_chart(filter_key, _product_month_units):
+    """Grouped bar chart of units sold per month for every product."""
+    fig = px.bar(
+        _product_month_units,
+        x="Month",
+        y="Units_Sold",
+        color="Product_Name",
+        barmode="group",
+        labels={"Units_Sold": "Units Sold", "Month": "Month"}
+    )
+    fig.update_layout(height=500, hovermode="x unified")
+    return fig
 
 # Load data
-df = load_data()
+df, all_products, all_months = load_data()
 
 # Header
 st.markdown('<h1 class="main-header">📊 SmartStock Inventory Optimization Dashboard</h1>', unsafe_allow_html=True)
@@ -66,21 +281,23 @@ st.markdown("---")
 st.sidebar.header("🔍 Filters")
 selected_products = st.sidebar.multiselect(
     "Select Products",
-    options=df["Product_Name"].unique(),
-    default=df["Product_Name"].unique()
+    options=all_products,
+    default=all_products
 )
 
 selected_months = st.sidebar.multiselect(
     "Select Months",
-    options=df["Month"].unique(),
-    default=df["Month"].unique()
+    options=all_months,
+    default=all_months
 )
 
-# Filter data
-filtered_df = df[
-    (df["Product_Name"].isin(selected_products)) & 
-    (df["Month"].isin(selected_months))
-]
+# Filter data (filter_key identifies the selection for the cached charts)
+filter_key = (tuple(selected_products), tuple(selected_months))
+filtered_df = select(df, selected_products, selected_months)
+# One point per product and month for the trend charts, instead of every row
+product_month_units = filtered_df.groupby(["Product_Name", "Month"], observed=True, sort=False)["Units_Sold"].sum().reset_index()
+monthly_summary = monthly_agg(filter_key, filtered_df)
+product_summary = product_agg((tuple(sorted(selected_products)), tuple(sorted(selected_months))))
 
 # Key Metrics Row
 st.subheader("📈 Key Performance Indicators")
@@ -122,40 +339,18 @@ with tab1:
     with col1:
         # Top products by sales value
         st.markdown("#### Top 10 Best-Selling Products")
-        top_products = filtered_df.groupby("Product_Name")["Total_Sales_Value"].sum().sort_values(ascending=False).head(10).reset_index()
-        fig = px.bar(
-            top_products, 
-            x="Product_Name", 
-            y="Total_Sales_Value",
-            color="Total_Sales_Value",
-            color_continuous_scale="Blues",
-            labels={"Total_Sales_Value": "Sales Value ($)", "Product_Name": "Product"}
-        )
-        fig.update_layout(showlegend=False, height=400)
-        st.plotly_chart(fig, width='stretch')
+        st.plotly_chart(top_products_chart(filter_key, product_summary), width='stretch')
     
     with col2:
         # Monthly sales distribution
         st.markdown("#### Monthly Sales Distribution")
-        monthly_sales = filtered_df.groupby("Month")["Total_Sales_Value"].sum().reset_index()
-        fig = px.pie(
-            monthly_sales,
-            values="Total_Sales_Value",
-            names="Month",
-            hole=0.4,
-            color_discrete_sequence=px.colors.sequential.RdBu
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, width='stretch')
+        st.plotly_chart(monthly_sales_chart(filter_key, monthly_summary), width='stretch')
     
     # Product performance table
     st.markdown("#### Product Performance Summary")
-    summary = filtered_df.groupby("Product_Name").agg({
-        "Units_Sold": "sum",
-        "Total_Sales_Value": "sum",
-        "Opening_Stock": "mean",
-        "Stock_Efficiency": "mean"
-    }).round(2).sort_values("Total_Sales_Value", ascending=False)
+    summary = product_summary[
+        ["Units_Sold", "Total_Sales_Value", "Opening_Stock", "Stock_Efficiency"]
+    ].round(2).sort_values("Total_Sales_Value", ascending=False)
     summary.columns = ["Total Units Sold", "Total Sales ($)", "Avg Opening Stock", "Avg Efficiency (%)"]
     st.dataframe(summary, width='stretch')
 
@@ -167,45 +362,16 @@ with tab2:
     with col1:
         # Sales trend by product over time
         st.markdown("#### Sales Trend by Product")
-        fig = px.line(
-            filtered_df,
-            x="Month",
-            y="Units_Sold",
-            color="Product_Name",
-            markers=True,
-            labels={"Units_Sold": "Units Sold", "Month": "Month"}
-        )
-        fig.update_layout(height=400, hovermode='x unified')
-        st.plotly_chart(fig, width='stretch')
+        st.plotly_chart(sales_trend_chart(filter_key, product_month_units), width='stretch')
     
     with col2:
         # Price vs Units Sold scatter
         st.markdown("#### Price vs Sales Performance")
-        fig = px.scatter(
-            filtered_df,
-            x="Price",
-            y="Units_Sold",
-            size="Opening_Stock",
-            color="Product_Name",
-            hover_data=["Month"],
-            labels={"Price": "Price ($)", "Units_Sold": "Units Sold", "Opening_Stock": "Stock"}
-        )
-        fig.update_layout(height=400)
-        st.plotly_chart(fig, width='stretch')
+        st.plotly_chart(price_scatter_chart(filter_key, filtered_df), width='stretch')
     
     # Units sold distribution
     st.markdown("#### Units Sold Distribution")
-    fig = px.histogram(
-        filtered_df,
-        x="Units_Sold",
-        nbins=20,
-        color_discrete_sequence=["#1f77b4"],
-        labels={"Units_Sold": "Units Sold"}
-    )
-    fig.add_vline(x=filtered_df["Units_Sold"].mean(), line_dash="dash", line_color="red",
-                  annotation_text="Mean", annotation_position="top")
-    fig.update_layout(height=400)
-    st.plotly_chart(fig, width='stretch')
+    st.plotly_chart(units_histogram_chart(filter_key, filtered_df), width='stretch')
 
 with tab3:
     st.subheader("Risk Analysis & Inventory Management")
@@ -237,20 +403,7 @@ with tab3:
     
     # Stock efficiency heatmap
     st.markdown("#### Stock Efficiency Heatmap")
-    pivot = filtered_df.pivot_table(
-        values="Stock_Efficiency",
-        index="Product_Name",
-        columns="Month",
-        aggfunc="mean"
-    )
-    fig = px.imshow(
-        pivot,
-        labels=dict(x="Month", y="Product", color="Efficiency (%)"),
-        color_continuous_scale="RdYlGn",
-        aspect="auto"
-    )
-    fig.update_layout(height=500)
-    st.plotly_chart(fig, width='stretch')
+    st.plotly_chart(efficiency_heatmap_chart(filter_key, filtered_df), width='stretch')
 
 with tab4:
     st.subheader("Revenue Insights")
@@ -260,64 +413,23 @@ with tab4:
     with col1:
         # Revenue by product
         st.markdown("#### Revenue Distribution")
-        revenue_data = filtered_df.groupby("Product_Name")["Total_Sales_Value"].sum().reset_index()
-        fig = px.treemap(
-            revenue_data,
-            path=["Product_Name"],
-            values="Total_Sales_Value",
-            color="Total_Sales_Value",
-            color_continuous_scale="Greens"
-        )
-        fig.update_layout(height=450)
-        st.plotly_chart(fig, width='stretch')
+        st.plotly_chart(revenue_treemap_chart(filter_key, product_summary), width='stretch')
     
     with col2:
         # Revenue per unit analysis
         st.markdown("#### Revenue Per Unit")
-        filtered_df["Revenue_Per_Unit"] = filtered_df["Total_Sales_Value"] / filtered_df["Units_Sold"]
-        rpu = filtered_df.groupby("Product_Name")["Revenue_Per_Unit"].mean().sort_values(ascending=False).reset_index()
-        fig = px.bar(
-            rpu,
-            x="Revenue_Per_Unit",
-            y="Product_Name",
-            orientation="h",
-            color="Revenue_Per_Unit",
-            color_continuous_scale="Viridis",
-            labels={"Revenue_Per_Unit": "Revenue/Unit ($)", "Product_Name": "Product"}
-        )
-        fig.update_layout(height=450)
-        st.plotly_chart(fig, width='stretch')
+        st.plotly_chart(revenue_per_unit_chart(filter_key, product_summary), width='stretch')
     
     # Monthly revenue trend
     st.markdown("#### Monthly Revenue Trend")
-    monthly_revenue = filtered_df.groupby("Month_Num").agg({
-        "Total_Sales_Value": "sum",
-        "Units_Sold": "sum"
-    }).reset_index()
-    
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-    fig.add_trace(
-        go.Bar(x=monthly_revenue["Month_Num"], y=monthly_revenue["Total_Sales_Value"], 
-               name="Revenue", marker_color="#1f77b4"),
-        secondary_y=False
-    )
-    fig.add_trace(
-        go.Scatter(x=monthly_revenue["Month_Num"], y=monthly_revenue["Units_Sold"],
-                   name="Units", mode="lines+markers", marker_color="orange"),
-        secondary_y=True
-    )
-    fig.update_xaxes(title_text="Month")
-    fig.update_yaxes(title_text="Revenue ($)", secondary_y=False)
-    fig.update_yaxes(title_text="Units Sold", secondary_y=True)
-    fig.update_layout(height=400, hovermode="x unified")
-    st.plotly_chart(fig, width='stretch')
+    st.plotly_chart(monthly_revenue_chart(filter_key, monthly_summary), width='stretch')
 
 with tab5:
     st.subheader("Time Series Analysis")
     
     # Product selection for detailed view
-    selected_product = st.selectbox("Select Product for Detailed Analysis", df["Product_Name"].unique())
-    product_data = df[df["Product_Name"] == selected_product]
+    selected_product = st.selectbox("Select Product for Detailed Analysis", all_products)
+    product_data = df.xs(selected_product, level="Product_Name").reset_index()
     
     col1, col2 = st.columns(2)
     
@@ -359,16 +471,7 @@ with tab5:
     
     # All products comparison
     st.markdown("#### All Products - Monthly Comparison")
-    fig = px.bar(
-        filtered_df,
-        x="Month",
-        y="Units_Sold",
-        color="Product_Name",
-        barmode="group",
-        labels={"Units_Sold": "Units Sold", "Month": "Month"}
-    )
-    fig.update_layout(height=500, hovermode="x unified")
-    st.plotly_chart(fig, width='stretch')
+    st.plotly_chart(monthly_comparison_chart(filter_key, product_month_units), width='stretch')
 
 # Footer
 st.markdown("---")
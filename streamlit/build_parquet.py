@@ -0,0 +1,82 @@
+"""
+Dashboard Data Builder
+----------------------
+Precomputes the dashboard's derived columns and stores them as Parquet.
+Author: Toshit Dwivedi
+Project: Smart Stock Inventory Optimization
+"""
+
+
+import numpy as np
+
+from data_loader import load
+
+# Configure paths (run from project root)
+DATA_PATH = "dataset/updated_dataset.csv"
+DASHBOARD_PATH = "dataset/dashboard_data.parquet"
+
+# Share of opening stock sold above which a record counts as a stockout risk
+STOCKOUT_RISK_RATIO = 0.7
+
+
+def add_dashboard_columns(df):
+    """
+    Add the dashboard's derived columns to a DataFrame in place.
+
+    Parameters:
+    -----------
+    df : pandas.DataFrame
+        Processed sales dataset
+
+    Returns:
+    --------
+    pandas.DataFrame : The same DataFrame with Sales_to_Stock_Ratio,
+        Stockout_Risk and Stock_Efficiency added
+    """
+    ratio = df["Units_Sold"].to_numpy() / df["Opening_Stock"].to_numpy()
+    df["Sales_to_Stock_Ratio"] = ratio
+    df["Stockout_Risk"] = ratio > STOCKOUT_RISK_RATIO
+    df["Stock_Efficiency"] = (ratio * 100).round(2)
+
+    return df
+
+
+def build(data_path=DATA_PATH, output_path=DASHBOARD_PATH):
+    """
+    Build the dashboard Parquet file from the processed dataset.
+
+    Product_Name and Month are stored as categoricals, so the dashboard's
+    groupbys and filters work on integer codes rather than strings, and the
+    numeric columns are stored as 32-bit types where that is exact.
+
+    Parameters:
+    -----------
+    data_path : str
+        Processed dataset CSV
+    output_path : str
+        Parquet file to write
+
+    Returns:
+    --------
+    pandas.DataFrame : Dashboard dataset
+    """
+    df = add_dashboard_columns(load(data_path))
+
+    # Group and filter keys as integer-coded categoricals (Month already is one)
+    df["Product_Name"] = df["Product_Name"].astype("category")
+
+    # data_loader already narrows the unit, stock and price columns; sales values
+    # are whole numbers, so int32 halves the column and stays exact
+    sales = df["Total_Sales_Value"]
+    if sales.dtype.kind == "i" and sales.abs().max() < np.iinfo(np.int32).max:
+        df["Total_Sales_Value"] = sales.astype(np.int32)
+    df.to_parquet(output_path, engine="pyarrow", compression="zstd", index=False)
+
+    return df
+
+
+if __name__ == "__main__":
+    dashboard_df = build()
+    print(f"✓ Dashboard data saved: {DASHBOARD_PATH}")
+    print(f"  Records: {len(dashboard_df)}")
+    print(f"  Columns: {len(dashboard_df.columns)}")